@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# Use uv run test_validation.py (or pytest) to run this script
+"""
+Offline checks for batch task validation. No TickTick credentials needed.
+"""
+
+import asyncio
+import os
+import sys
+
+os.environ.setdefault("TICKTICK_ACCESS_TOKEN", "offline-test-token")
+
+from ticktick_mcp.src.server import _validate_task_data, batch_create_tasks
+
+def test_batch_priority_must_be_a_valid_int():
+    """Unhashable or non-int priorities are reported per task, not raised."""
+    for priority in ([5], {}, {"level": 5}, "5", True, 2):
+        task = {"title": "a", "project_id": "p1", "priority": priority}
+        error = _validate_task_data(task, 0)
+        assert error is not None and error.startswith("Task 1: Invalid priority"), (priority, error)
+    
+    for priority in (0, 1, 3, 5, None):
+        task = {"title": "a", "project_id": "p1", "priority": priority}
+        assert _validate_task_data(task, 0) is None, priority
+
+def test_batch_create_reports_list_priority():
+    """A list priority fails validation before any request is made."""
+    result = asyncio.run(batch_create_tasks(tasks=[{"title": "a", "project_id": "p1", "priority": [5]}]))
+    assert result.startswith("Validation errors found:"), result
+    assert "Task 1: Invalid priority [5]" in result, result
+
+if __name__ == "__main__":
+    test_batch_priority_must_be_a_valid_int()
+    test_batch_create_reports_list_priority()
+    print("✅ Batch validation checks passed")
+    sys.exit(0)
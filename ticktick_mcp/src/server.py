@@ -1,13 +1,16 @@
 import asyncio
-import json
+import functools
 import os
+import re
+import threading
 import logging
 from datetime import datetime, timezone, date, timedelta
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 
+import anyio
 from mcp.server.fastmcp import FastMCP
 
-from .ticktick_client import TickTickClient
+from .ticktick_client import TickTickClient, TaskValidator, parse_iso_datetime
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -16,6 +19,12 @@ logger = logging.getLogger(__name__)
 # Create FastMCP server
 mcp = FastMCP("ticktick")
 
+# Accepted values for tool arguments, built once for O(1) membership checks
+VALID_PRIORITIES = frozenset(TaskValidator.VALID_PRIORITIES)
+VALID_VIEW_MODES = frozenset({"list", "kanban", "timeline"})
+
+PRIORITY_MAP = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+
 # Module-level client instance (process-scoped, not global across users)
 # In LibreChat multi-user mode, each user gets a separate process with their own instance
 # Custom exceptions for better error handling
@@ -31,42 +40,25 @@ class TickTickNetworkError(Exception):
     """Raised when network connectivity issues prevent API communication."""
     pass
 
-_client_instance = None
+_client_lock = threading.Lock()
 
-def get_client() -> TickTickClient:
+@functools.lru_cache(maxsize=1)
+def _build_client(access_token: str) -> TickTickClient:
     """
-    Get or create the TickTick client for this process.
+    Create and verify a TickTick client for the given access token.
     
-    In LibreChat multi-user mode:
-    - Each user gets a separate process spawned by LibreChat
-    - Process has user-specific tokens in environment variables
-    - Client is lazily initialized on first tool call
-    - Client instance is reused for subsequent calls in same process
+    Cached per token, so a changed TICKTICK_ACCESS_TOKEN automatically yields a
+    fresh client. Failures raise and are therefore never cached.
     
-    Returns:
-        TickTickClient: Initialized client with user's tokens
-        
     Raises:
         TickTickAuthenticationError: If tokens are missing or invalid
         TickTickAPIError: If TickTick API returns an error
         TickTickNetworkError: If network connectivity fails
     """
-    global _client_instance
-    
-    if _client_instance is not None:
-        return _client_instance
-    
     try:
-        # Check if tokens are available (should be set by LibreChat)
-        if os.getenv("TICKTICK_ACCESS_TOKEN") is None:
-            raise TickTickAuthenticationError(
-                "TICKTICK_ACCESS_TOKEN not found in environment. "
-                "Please authenticate with TickTick in LibreChat."
-            )
-        
         # Initialize client (reads from env vars)
         try:
-            _client_instance = TickTickClient()
+            client = TickTickClient()
             logger.info("TickTick client initialized successfully")
         except ValueError as e:
             # TickTickClient raises ValueError for missing tokens
@@ -74,11 +66,10 @@ def get_client() -> TickTickClient:
         
         # Test API connectivity
         try:
-            projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = _client_instance.get_projects()
+            projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
             if isinstance(projects_result, dict) and 'error' in projects_result:
                 error_msg = projects_result['error']
                 logger.error(f"Failed to connect to TickTick API: {error_msg}")
-                _client_instance = None  # Reset on failure
                 
                 # Determine error type from message
                 if 'auth' in error_msg.lower() or 'token' in error_msg.lower() or '401' in error_msg:
@@ -89,23 +80,51 @@ def get_client() -> TickTickClient:
             # Type narrowing: projects_result must be a List
             projects: List[Dict[str, Any]] = projects_result  # type: ignore
             logger.info(f"Connected to TickTick API with {len(projects)} projects")
-            return _client_instance
+            return client
             
         except (ConnectionError, TimeoutError) as e:
             logger.error(f"Network error connecting to TickTick: {e}")
-            _client_instance = None
             raise TickTickNetworkError(f"Network connectivity issue: {str(e)}")
         
     except (TickTickAuthenticationError, TickTickAPIError, TickTickNetworkError):
         # Re-raise our custom exceptions
-        _client_instance = None
         raise
     except Exception as e:
         # Catch any other unexpected errors
         logger.error(f"Unexpected error initializing TickTick client: {e}")
-        _client_instance = None
         raise TickTickAPIError(f"Unexpected error: {str(e)}")
 
+def get_client() -> TickTickClient:
+    """
+    Get or create the TickTick client for this process.
+    
+    In LibreChat multi-user mode:
+    - Each user gets a separate process spawned by LibreChat
+    - Process has user-specific tokens in environment variables
+    - Client is lazily initialized on first tool call
+    - Client instance is reused for subsequent calls in same process
+    
+    Returns:
+        TickTickClient: Initialized client with user's tokens
+        
+    Raises:
+        TickTickAuthenticationError: If tokens are missing or invalid
+        TickTickAPIError: If TickTick API returns an error
+        TickTickNetworkError: If network connectivity fails
+    """
+    # Check if tokens are available (should be set by LibreChat)
+    access_token = os.getenv("TICKTICK_ACCESS_TOKEN")
+    if access_token is None:
+        raise TickTickAuthenticationError(
+            "TICKTICK_ACCESS_TOKEN not found in environment. "
+            "Please authenticate with TickTick in LibreChat."
+        )
+    
+    # Serialize construction so a tool call racing the startup warm-up waits for
+    # it instead of building and probing a second client
+    with _client_lock:
+        return _build_client(access_token)
+
 def initialize_client() -> bool:
     """
     Initialize client and return success status.
@@ -121,106 +140,210 @@ def initialize_client() -> bool:
         logger.error(f"Client initialization failed: {e}")
         return False
 
+def _warm_client() -> None:
+    """Build and probe the client in the background so startup isn't blocked on the API."""
+    if initialize_client():
+        logger.info("TickTick client warmed up")
+
+# Fixed lines of format_task: every known priority and both statuses
+_PRIORITY_LINES = {priority: f"Priority: {label}\n" for priority, label in PRIORITY_MAP.items()}
+_STATUS_COMPLETED_LINE = "Status: Completed\n"
+_STATUS_ACTIVE_LINE = "Status: Active\n"
+
+# Subtask check boxes in format_task, indexed by "is completed"
+_SUBTASK_CHECKS = ("□", "✓")
+
 # Format a task object from TickTick for better display
 def format_task(task: Dict) -> str:
     """Format a task into a human-readable string."""
-    formatted = f"ID: {task.get('id', 'No ID')}\n"
-    formatted += f"Title: {task.get('title', 'No title')}\n"
+    parts: List[str] = []
+    _append_task(parts, task)
+    return "".join(parts)
+
+def _append_task(parts: List[str], task: Dict) -> None:
+    """
+    Append format_task's output for a task to a caller-owned buffer.
+    
+    List tools format many tasks into one buffer and join once, instead of
+    building and joining an intermediate string per task.
+    """
+    append = parts.append
+    append(f"ID: {task.get('id', 'No ID')}\n")
+    append(f"Title: {task.get('title', 'No title')}\n")
     
     # Add project ID
-    formatted += f"Project ID: {task.get('projectId', 'None')}\n"
+    append(f"Project ID: {task.get('projectId', 'None')}\n")
     
     # Add dates if available
-    if task.get('startDate'):
-        formatted += f"Start Date: {task.get('startDate')}\n"
-    if task.get('dueDate'):
-        formatted += f"Due Date: {task.get('dueDate')}\n"
+    start_date = task.get('startDate')
+    if start_date:
+        append(f"Start Date: {start_date}\n")
+    due_date = task.get('dueDate')
+    if due_date:
+        append(f"Due Date: {due_date}\n")
     
     # Add priority if available
-    priority_map = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
     priority = task.get('priority', 0)
-    formatted += f"Priority: {priority_map.get(priority, str(priority))}\n"
+    append(_PRIORITY_LINES.get(priority) or f"Priority: {priority}\n")
     
     # Add status if available
-    status = "Completed" if task.get('status') == 2 else "Active"
-    formatted += f"Status: {status}\n"
+    append(_STATUS_COMPLETED_LINE if task.get('status') == 2 else _STATUS_ACTIVE_LINE)
     
     # Add content if available
-    if task.get('content'):
-        formatted += f"\nContent:\n{task.get('content')}\n"
+    content = task.get('content')
+    if content:
+        append(f"\nContent:\n{content}\n")
     
     # Add subtasks if available
     items = task.get('items', [])
     if items:
-        formatted += f"\nSubtasks ({len(items)}):\n"
+        append(f"\nSubtasks ({len(items)}):\n")
         for i, item in enumerate(items, 1):
-            status = "✓" if item.get('status') == 1 else "□"
-            formatted += f"{i}. [{status}] {item.get('title', 'No title')}\n"
-    
-    return formatted
+            check = _SUBTASK_CHECKS[item.get('status') == 1]
+            append(f"{i}. [{check}] {item.get('title', 'No title')}\n")
 
 # Format a project object from TickTick for better display
 def format_project(project: Dict) -> str:
     """Format a project into a human-readable string."""
-    formatted = f"Name: {project.get('name', 'No name')}\n"
-    formatted += f"ID: {project.get('id', 'No ID')}\n"
+    parts = [f"Name: {project.get('name', 'No name')}\n"]
+    append = parts.append
+    append(f"ID: {project.get('id', 'No ID')}\n")
     
     # Add color if available
-    if project.get('color'):
-        formatted += f"Color: {project.get('color')}\n"
+    color = project.get('color')
+    if color:
+        append(f"Color: {color}\n")
     
     # Add view mode if available
-    if project.get('viewMode'):
-        formatted += f"View Mode: {project.get('viewMode')}\n"
+    view_mode = project.get('viewMode')
+    if view_mode:
+        append(f"View Mode: {view_mode}\n")
     
     # Add closed status if available
     if 'closed' in project:
-        formatted += f"Closed: {'Yes' if project.get('closed') else 'No'}\n"
+        append(f"Closed: {'Yes' if project['closed'] else 'No'}\n")
     
     # Add kind if available
-    if project.get('kind'):
-        formatted += f"Kind: {project.get('kind')}\n"
+    kind = project.get('kind')
+    if kind:
+        append(f"Kind: {kind}\n")
     
-    return formatted
+    return "".join(parts)
+
+# Error-dict formatting. Tool-specific wording is passed in by the caller; the
+# rest is table-driven so each tool doesn't re-implement the same if/elif chain
+_ERROR_RESPONSE_TEMPLATES = {
+    'auth': "❌ Authentication Error: {error}\n\nPlease re-authenticate with TickTick in LibreChat.",
+    'permission': "❌ Permission Denied: {error}\n\n{permission_hint}",
+    'network': "❌ Network Error: {error}\n\nPlease check your internet connection and try again.",
+    'timeout': "❌ Network Error: {error}\n\nTickTick took too long to respond. Please try again.",
+    'server_error': "❌ {error}",
+}
+_DEFAULT_ERROR_TEMPLATE = "❌ API Error: {error}"
+
+def parse_error_response(
+    response: Dict[str, Any],
+    permission_hint: str = "You don't have access to this resource.",
+    not_found: Optional[str] = None
+) -> str:
+    """
+    Format an error dict returned by TickTickClient into a user-facing message.
+    
+    Args:
+        response: Error dict with 'error' and optionally 'type' keys
+        permission_hint: Explanation appended to permission-denied errors
+        not_found: Complete message for not-found errors (falls back to the
+            generic API error message when omitted)
+    
+    Returns:
+        Formatted error message
+    """
+    error_type = response.get('type', 'unknown')
+    if error_type == 'not_found' and not_found is not None:
+        return not_found
+    
+    return _format_error_response(error_type, response['error'], permission_hint)
+
+@functools.lru_cache(maxsize=64)
+def _format_error_response(error_type: str, error: str, permission_hint: str) -> str:
+    """
+    Pure formatting step of parse_error_response.
+    
+    Cached on the extracted fields, so the same failure repeating across tool
+    calls (e.g. an expired token) formats its message once. The not-found
+    message embeds a per-call ID and is handled by the caller instead.
+    """
+    template = _ERROR_RESPONSE_TEMPLATES.get(error_type, _DEFAULT_ERROR_TEMPLATE)
+    return template.format(error=error, permission_hint=permission_hint)
+
+# Messages for exceptions escaping a tool; only the exception text varies
+_API_ERROR_MSG = "❌ TickTick API Error: {}\n\nThe TickTick service may be experiencing issues."
+_VALIDATION_ERROR_MSG = "❌ Validation Error: {}"
+_NETWORK_ERROR_MSG = "❌ Network Error: {}\n\nPlease check your internet connection and try again."
+_AUTH_ERROR_MSG = "❌ Authentication Error: {}\n\nPlease authenticate with TickTick in LibreChat."
+_UNEXPECTED_ERROR_MSG = "❌ Unexpected Error: {}"
+
+def handle_mcp_errors(func):
+    """
+    Decorator that turns exceptions raised by an MCP tool into user-facing messages.
+    
+    Apply beneath @mcp.tool(); functools.wraps preserves the signature and
+    docstring FastMCP builds the tool schema from.
+    """
+    fname = func.__name__
+    
+    # The exception types are unrelated, so clause order only affects how many
+    # checks an error goes through; the most frequent ones come first
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs) -> str:
+        try:
+            return await func(*args, **kwargs)
+        except TickTickAPIError as e:
+            logger.error("API error in %s: %s", fname, e)
+            return _API_ERROR_MSG.format(e)
+        except ValueError as e:
+            # Validation errors from TaskValidator
+            logger.error("Validation error in %s: %s", fname, e)
+            return _VALIDATION_ERROR_MSG.format(e)
+        except TickTickNetworkError as e:
+            logger.error("Network error in %s: %s", fname, e)
+            return _NETWORK_ERROR_MSG.format(e)
+        except TickTickAuthenticationError as e:
+            logger.error("Authentication error in %s: %s", fname, e)
+            return _AUTH_ERROR_MSG.format(e)
+        except Exception as e:
+            logger.error("Unexpected error in %s: %s", fname, e, exc_info=True)
+            return _UNEXPECTED_ERROR_MSG.format(e)
+    
+    return wrapper
 
 # MCP Tools
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_projects() -> str:
     """Get all projects from TickTick."""
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        # Check if result is an error dict
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        # Type narrowing: at this point, projects_result must be a List
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        if not projects:
-            return "No projects found."
-        
-        result = f"Found {len(projects)} projects:\n\n"
-        for i, project in enumerate(projects, 1):
-            result += f"Project {i}:\n" + format_project(project) + "\n"
-        
-        return result
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_projects: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in the LibreChat UI."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_projects: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues. Please try again later."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_projects: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_projects: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    # Check if result is an error dict
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    # Type narrowing: at this point, projects_result must be a List
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    if not projects:
+        return "No projects found."
+    
+    parts = [f"Found {len(projects)} projects:\n\n"]
+    for i, project in enumerate(projects, 1):
+        parts.append(f"Project {i}:\n{format_project(project)}\n")
+    
+    return "".join(parts)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_project(project_id: str) -> str:
     """
     Get details about a specific project.
@@ -228,40 +351,20 @@ async def get_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    try:
-        client = get_client()
-        project = client.get_project(project_id)
-        
-        if 'error' in project:
-            error_type = project.get('type', 'unknown')
-            error_msg = project['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have access to this project."
-            elif error_type == 'not_found':
-                return f"❌ Project Not Found: The project may have been deleted.\n\nProject ID: {project_id}"
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return format_project(project)
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_project: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_project: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_project: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_project: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    project = await asyncio.to_thread(client.get_project, project_id)
+    
+    if 'error' in project:
+        return parse_error_response(
+            project,
+            permission_hint="You don't have access to this project.",
+            not_found=f"❌ Project Not Found: The project may have been deleted.\n\nProject ID: {project_id}"
+        )
+    
+    return format_project(project)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_project_tasks(project_id: str) -> str:
     """
     Get all tasks in a specific project.
@@ -269,48 +372,30 @@ async def get_project_tasks(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    try:
-        client = get_client()
-        project_data = client.get_project_with_data(project_id)
-        
-        if 'error' in project_data:
-            error_type = project_data.get('type', 'unknown')
-            error_msg = project_data['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have access to this project."
-            elif error_type == 'not_found':
-                return f"❌ Project Not Found: The project may have been deleted.\n\nProject ID: {project_id}"
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        tasks = project_data.get('tasks', [])
-        if not tasks:
-            return f"No tasks found in project '{project_data.get('project', {}).get('name', project_id)}'."
-        
-        result = f"Found {len(tasks)} tasks in project '{project_data.get('project', {}).get('name', project_id)}':\n\n"
-        for i, task in enumerate(tasks, 1):
-            result += f"Task {i}:\n" + format_task(task) + "\n"
-        
-        return result
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_project_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_project_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_project_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_project_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    project_data = await asyncio.to_thread(client.get_project_with_data, project_id)
+    
+    if 'error' in project_data:
+        return parse_error_response(
+            project_data,
+            permission_hint="You don't have access to this project.",
+            not_found=f"❌ Project Not Found: The project may have been deleted.\n\nProject ID: {project_id}"
+        )
+    
+    tasks = project_data.get('tasks', [])
+    if not tasks:
+        return f"No tasks found in project '{project_data.get('project', {}).get('name', project_id)}'."
+    
+    parts = [f"Found {len(tasks)} tasks in project '{project_data.get('project', {}).get('name', project_id)}':\n\n"]
+    for i, task in enumerate(tasks, 1):
+        parts.append(f"Task {i}:\n")
+        _append_task(parts, task)
+        parts.append("\n")
+    
+    return "".join(parts)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_task(project_id: str, task_id: str) -> str:
     """
     Get details about a specific task.
@@ -319,40 +404,20 @@ async def get_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    try:
-        client = get_client()
-        task = client.get_task(project_id, task_id)
-        
-        if 'error' in task:
-            error_type = task.get('type', 'unknown')
-            error_msg = task['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have access to this task."
-            elif error_type == 'not_found':
-                return f"❌ Task Not Found: The task may have been deleted.\n\nTask ID: {task_id}\nProject ID: {project_id}"
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return format_task(task)
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_task: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_task: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_task: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_task: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    task = await asyncio.to_thread(client.get_task, project_id, task_id)
+    
+    if 'error' in task:
+        return parse_error_response(
+            task,
+            permission_hint="You don't have access to this task.",
+            not_found=f"❌ Task Not Found: The task may have been deleted.\n\nTask ID: {task_id}\nProject ID: {project_id}"
+        )
+    
+    return format_task(task)
 
 @mcp.tool()
+@handle_mcp_errors
 async def create_task(
     title: str, 
     project_id: str, 
@@ -373,50 +438,32 @@ async def create_task(
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
     """
     # Validate priority
-    if priority not in [0, 1, 3, 5]:
+    if priority not in VALID_PRIORITIES:
         return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
     
-    try:
-        # Validate dates if provided
-        for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
-            if date_str:
-                try:
-                    datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
-        
-        client = get_client()
-        task = client.create_task(
-            title=title,
-            project_id=project_id,
-            content=content,
-            start_date=start_date,
-            due_date=due_date,
-            priority=priority
-        )
-        
-        if 'error' in task:
-            return f"Error creating task: {task['error']}"
-        
-        return f"Task created successfully:\n\n" + format_task(task)
-    except ValueError as e:
-        # Validation errors from TaskValidator
-        logger.error(f"Validation error in create_task: {e}")
-        return f"❌ Validation Error: {str(e)}"
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in create_task: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in the LibreChat UI."
-    except TickTickAPIError as e:
-        logger.error(f"API error in create_task: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe task could not be created. Please verify the project_id and try again."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in create_task: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in create_task: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    # Validate dates if provided
+    date_error = _validate_iso_dates(start_date=start_date, due_date=due_date)
+    if date_error:
+        return date_error
+    
+    client = await asyncio.to_thread(get_client)
+    task = await asyncio.to_thread(
+        client.create_task,
+        title=title,
+        project_id=project_id,
+        content=content,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority
+    )
+    
+    if 'error' in task:
+        return f"Error creating task: {task['error']}"
+    
+    return f"Task created successfully:\n\n" + format_task(task)
 
 @mcp.tool()
+@handle_mcp_errors
 async def update_task(
     task_id: str,
     project_id: str,
@@ -439,63 +486,37 @@ async def update_task(
         priority: New priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
     """
     # Validate priority if provided
-    if priority is not None and priority not in [0, 1, 3, 5]:
+    if priority is not None and priority not in VALID_PRIORITIES:
         return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
     
-    try:
-        # Validate dates if provided
-        for date_str, date_name in [(start_date, "start_date"), (due_date, "due_date")]:
-            if date_str:
-                try:
-                    datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except ValueError:
-                    return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
-        
-        client = get_client()
-        task = client.update_task(
-            task_id=task_id,
-            project_id=project_id,
-            title=title,
-            content=content,
-            start_date=start_date,
-            due_date=due_date,
-            priority=priority
+    # Validate dates if provided
+    date_error = _validate_iso_dates(start_date=start_date, due_date=due_date)
+    if date_error:
+        return date_error
+    
+    client = await asyncio.to_thread(get_client)
+    task = await asyncio.to_thread(
+        client.update_task,
+        task_id=task_id,
+        project_id=project_id,
+        title=title,
+        content=content,
+        start_date=start_date,
+        due_date=due_date,
+        priority=priority
+    )
+    
+    if 'error' in task:
+        return parse_error_response(
+            task,
+            permission_hint="You don't have permission to update this task.",
+            not_found=f"❌ Task Not Found: The task may have been deleted.\n\nTask ID: {task_id}\nPlease verify the task still exists."
         )
-        
-        if 'error' in task:
-            error_type = task.get('type', 'unknown')
-            error_msg = task['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to update this task."
-            elif error_type == 'not_found':
-                return f"❌ Task Not Found: The task may have been deleted.\n\nTask ID: {task_id}\nPlease verify the task still exists."
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"Task updated successfully:\n\n" + format_task(task)
-    except ValueError as e:
-        # Validation errors from TaskValidator
-        logger.error(f"Validation error in update_task: {e}")
-        return f"❌ Validation Error: {str(e)}"
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in update_task: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in update_task: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to update the task. Please try again."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in update_task: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in update_task: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    
+    return f"Task updated successfully:\n\n" + format_task(task)
 
 @mcp.tool()
+@handle_mcp_errors
 async def complete_task(project_id: str, task_id: str) -> str:
     """
     Mark a task as complete.
@@ -504,40 +525,20 @@ async def complete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    try:
-        client = get_client()
-        result = client.complete_task(project_id, task_id)
-        
-        if 'error' in result:
-            error_type = result.get('type', 'unknown')
-            error_msg = result['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to complete this task."
-            elif error_type == 'not_found':
-                return f"❌ Task Not Found: Cannot complete task. It may have been deleted.\n\nTask ID: {task_id}"
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"✅ Task {task_id} marked as complete."
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in complete_task: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in complete_task: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to complete the task."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in complete_task: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in complete_task: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    result = await asyncio.to_thread(client.complete_task, project_id, task_id)
+    
+    if 'error' in result:
+        return parse_error_response(
+            result,
+            permission_hint="You don't have permission to complete this task.",
+            not_found=f"❌ Task Not Found: Cannot complete task. It may have been deleted.\n\nTask ID: {task_id}"
+        )
+    
+    return f"✅ Task {task_id} marked as complete."
 
 @mcp.tool()
+@handle_mcp_errors
 async def delete_task(project_id: str, task_id: str) -> str:
     """
     Delete a task.
@@ -546,40 +547,20 @@ async def delete_task(project_id: str, task_id: str) -> str:
         project_id: ID of the project
         task_id: ID of the task
     """
-    try:
-        client = get_client()
-        result = client.delete_task(project_id, task_id)
-        
-        if 'error' in result:
-            error_type = result.get('type', 'unknown')
-            error_msg = result['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to delete this task."
-            elif error_type == 'not_found':
-                return f"❌ Task Not Found: The task may have already been deleted.\n\nTask ID: {task_id}"
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"✅ Task {task_id} deleted successfully."
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in delete_task: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in delete_task: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to delete the task."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in delete_task: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in delete_task: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    result = await asyncio.to_thread(client.delete_task, project_id, task_id)
+    
+    if 'error' in result:
+        return parse_error_response(
+            result,
+            permission_hint="You don't have permission to delete this task.",
+            not_found=f"❌ Task Not Found: The task may have already been deleted.\n\nTask ID: {task_id}"
+        )
+    
+    return f"✅ Task {task_id} deleted successfully."
 
 @mcp.tool()
+@handle_mcp_errors
 async def create_project(
     name: str,
     color: str = "#F18181",
@@ -594,49 +575,27 @@ async def create_project(
         view_mode: View mode - one of list, kanban, or timeline (optional)
     """
     # Validate view_mode
-    if view_mode not in ["list", "kanban", "timeline"]:
+    if view_mode not in VALID_VIEW_MODES:
         return "Invalid view_mode. Must be one of: list, kanban, timeline."
     
-    try:
-        client = get_client()
-        project = client.create_project(
-            name=name,
-            color=color,
-            view_mode=view_mode
+    client = await asyncio.to_thread(get_client)
+    project = await asyncio.to_thread(
+        client.create_project,
+        name=name,
+        color=color,
+        view_mode=view_mode
+    )
+    
+    if 'error' in project:
+        return parse_error_response(
+            project,
+            permission_hint="You don't have permission to create projects."
         )
-        
-        if 'error' in project:
-            error_type = project.get('type', 'unknown')
-            error_msg = project['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to create projects."
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"✅ Project created successfully:\n\n" + format_project(project)
-    except ValueError as e:
-        # Validation errors from TaskValidator
-        logger.error(f"Validation error in create_project: {e}")
-        return f"❌ Validation Error: {str(e)}"
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in create_project: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in create_project: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to create the project."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in create_project: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in create_project: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    
+    return f"✅ Project created successfully:\n\n" + format_project(project)
 
 @mcp.tool()
+@handle_mcp_errors
 async def update_project(
     project_id: str,
     name: Optional[str] = None,
@@ -653,56 +612,33 @@ async def update_project(
         view_mode: New view mode - one of list, kanban, or timeline (optional)
     """
     # Validate view_mode if provided
-    if view_mode and view_mode not in ["list", "kanban", "timeline"]:
+    if view_mode and view_mode not in VALID_VIEW_MODES:
         return "Invalid view_mode. Must be one of: list, kanban, timeline."
     
     # Check that at least one field is being updated
     if not any([name, color, view_mode]):
         return "❌ No updates provided. Please specify at least one field to update (name, color, or view_mode)."
     
-    try:
-        client = get_client()
-        project = client.update_project(
-            project_id=project_id,
-            name=name,
-            color=color,
-            view_mode=view_mode
+    client = await asyncio.to_thread(get_client)
+    project = await asyncio.to_thread(
+        client.update_project,
+        project_id=project_id,
+        name=name,
+        color=color,
+        view_mode=view_mode
+    )
+    
+    if 'error' in project:
+        return parse_error_response(
+            project,
+            permission_hint="You don't have permission to update this project.",
+            not_found=f"❌ Project Not Found: The project may have been deleted.\n\nProject ID: {project_id}\nPlease verify the project still exists."
         )
-        
-        if 'error' in project:
-            error_type = project.get('type', 'unknown')
-            error_msg = project['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to update this project."
-            elif error_type == 'not_found':
-                return f"❌ Project Not Found: The project may have been deleted.\n\nProject ID: {project_id}\nPlease verify the project still exists."
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"✅ Project updated successfully:\n\n" + format_project(project)
-    except ValueError as e:
-        # Validation errors from TaskValidator
-        logger.error(f"Validation error in update_project: {e}")
-        return f"❌ Validation Error: {str(e)}"
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in update_project: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in update_project: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to update the project."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in update_project: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in update_project: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    
+    return f"✅ Project updated successfully:\n\n" + format_project(project)
 
 @mcp.tool()
+@handle_mcp_errors
 async def delete_project(project_id: str) -> str:
     """
     Delete a project.
@@ -710,107 +646,137 @@ async def delete_project(project_id: str) -> str:
     Args:
         project_id: ID of the project
     """
-    try:
-        client = get_client()
-        result = client.delete_project(project_id)
-        
-        if 'error' in result:
-            error_type = result.get('type', 'unknown')
-            error_msg = result['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to delete this project."
-            elif error_type == 'not_found':
-                return f"❌ Project Not Found: The project may have already been deleted.\n\nProject ID: {project_id}"
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"✅ Project {project_id} deleted successfully."
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in delete_project: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in delete_project: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to delete the project."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in delete_project: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in delete_project: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    result = await asyncio.to_thread(client.delete_project, project_id)
+    
+    if 'error' in result:
+        return parse_error_response(
+            result,
+            permission_hint="You don't have permission to delete this project.",
+            not_found=f"❌ Project Not Found: The project may have already been deleted.\n\nProject ID: {project_id}"
+        )
     
+    return f"✅ Project {project_id} deleted successfully."
+
 
 ### Improved Task MCP Tools
 
 # Helper Functions
 
-PRIORITY_MAP = {0: "None", 1: "Low", 3: "Medium", 5: "High"}
+# Maximum number of concurrent TickTick API requests when fanning out over
+# projects or batch-creating tasks
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
 
-def _is_task_due_today(task: Dict[str, Any]) -> bool:
-    """Check if a task is due today."""
-    due_date = task.get('dueDate')
-    if not due_date:
-        return False
-    
+def _read_max_concurrency() -> int:
+    """Read TICKTICK_MAX_CONCURRENCY, falling back to the default on bad input; at least 1."""
+    value = os.getenv("TICKTICK_MAX_CONCURRENCY")
+    if not value:
+        return DEFAULT_MAX_CONCURRENT_REQUESTS
     try:
-        task_due_date = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-        today_date = datetime.now(timezone.utc).date()
-        return task_due_date == today_date
-    except (ValueError, TypeError):
-        return False
+        limit = int(value)
+    except ValueError:
+        logger.warning(
+            "Ignoring invalid TICKTICK_MAX_CONCURRENCY=%r; using %d",
+            value, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+        return DEFAULT_MAX_CONCURRENT_REQUESTS
+    # A limit of 0 would make every fan-out wait forever on its semaphore
+    return max(1, limit)
 
-def _is_task_overdue(task: Dict[str, Any]) -> bool:
-    """Check if a task is overdue."""
+MAX_CONCURRENT_REQUESTS = _read_max_concurrency()
+
+def _parse_due_date(task: Dict[str, Any]) -> Optional[datetime]:
+    """Parse a task's dueDate into an aware datetime, or None if missing or invalid."""
     due_date = task.get('dueDate')
     if not due_date:
-        return False
+        return None
     
     try:
-        task_due = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z")
-        return task_due < datetime.now(timezone.utc)
+        # TickTick sends e.g. "2025-01-15T16:00:00.000+0000"
+        task_due = parse_iso_datetime(due_date)
     except (ValueError, TypeError):
-        return False
+        return None
+    
+    # Only offset-aware values can be compared with the UTC "now" of the callers
+    return task_due if task_due.tzinfo is not None else None
 
-def _is_task_due_in_days(task: Dict[str, Any], days: int) -> bool:
-    """Check if a task is due in exactly X days."""
-    due_date = task.get('dueDate')
-    if not due_date:
-        return False
+def _is_task_due_on(task: Dict[str, Any], target_date: date) -> bool:
+    """Check if a task is due on the given date."""
+    task_due = _parse_due_date(task)
+    return task_due is not None and task_due.date() == target_date
+
+def _is_task_overdue(task: Dict[str, Any], now: datetime) -> bool:
+    """Check if a task's due date is before `now`."""
+    task_due = _parse_due_date(task)
+    return task_due is not None and task_due < now
+
+def _classify_gtd_task(task: Dict[str, Any], now: datetime, today: date, tomorrow: date) -> Tuple[bool, bool]:
+    """
+    Classify a task for the GTD views in a single pass.
     
-    try:
-        task_due_date = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-        target_date = (datetime.now(timezone.utc) + timedelta(days=days)).date()
-        return task_due_date == target_date
-    except (ValueError, TypeError):
-        return False
+    Parses the due date at most once, instead of once per date helper.
+    
+    Args:
+        task: Task dictionary
+        now: Current UTC time, computed once per tool call by the caller
+        today: now.date(), precomputed by the caller
+        tomorrow: The day after today, precomputed by the caller
+    
+    Returns:
+        (is_engaged, is_next): engaged = high priority, overdue or due today;
+        next = medium priority or due tomorrow
+    """
+    priority = task.get('priority', 0)
+    is_engaged = priority == 5
+    is_next = priority == 3
+    
+    task_due = _parse_due_date(task)
+    if task_due is not None:
+        task_due_date = task_due.date()
+        is_engaged = is_engaged or task_due < now or task_due_date == today
+        is_next = is_next or task_due_date == tomorrow
+    
+    return is_engaged, is_next
 
-def _task_matches_search(task: Dict[str, Any], search_term: str) -> bool:
-    """Check if a task matches the search term (case-insensitive)."""
-    search_term = search_term.lower()
+def _task_matches_search(task: Dict[str, Any], pattern: re.Pattern) -> bool:
+    """
+    Check if a task matches a search pattern.
     
+    Args:
+        task: Task dictionary
+        pattern: Compiled, case-insensitive pattern built once per search
+    """
     # Search in title
-    title = task.get('title', '').lower()
-    if search_term in title:
+    if pattern.search(task.get('title', '')):
         return True
     
     # Search in content
-    content = task.get('content', '').lower()
-    if search_term in content:
+    if pattern.search(task.get('content', '')):
         return True
     
     # Search in subtasks
     items = task.get('items', [])
     for item in items:
-        item_title = item.get('title', '').lower()
-        if search_term in item_title:
+        if pattern.search(item.get('title', '')):
             return True
     
     return False
 
+def _validate_iso_dates(**dates: Optional[str]) -> Optional[str]:
+    """
+    Validate optional ISO date arguments of a tool call.
+    
+    Args:
+        **dates: Argument name -> date string (None or empty means not provided)
+    
+    Returns:
+        None if all provided dates are valid, error message for the first invalid one
+    """
+    for date_name, date_str in dates.items():
+        if date_str and not TaskValidator.is_valid_date(date_str):
+            return f"Invalid {date_name} format. Use ISO format: YYYY-MM-DDThh:mm:ss+0000"
+    return None
+
 def _validate_task_data(task_data: Dict[str, Any], task_index: int) -> Optional[str]:
     """
     Validate a single task's data for batch creation.
@@ -818,45 +784,77 @@ def _validate_task_data(task_data: Dict[str, Any], task_index: int) -> Optional[
     Returns:
         None if valid, error message string if invalid
     """
-    # Check required fields
-    if 'title' not in task_data or not task_data['title']:
+    # Check required fields (same emptiness rule as TaskValidator.validate_task_title)
+    title = task_data.get('title')
+    if title is not None and not isinstance(title, str):
+        return f"Task {task_index + 1}: 'title' must be a string"
+    if not title or title.isspace():
         return f"Task {task_index + 1}: 'title' is required and cannot be empty"
     
     if 'project_id' not in task_data or not task_data['project_id']:
         return f"Task {task_index + 1}: 'project_id' is required and cannot be empty"
     
+    # Check length limits up front so the whole batch is rejected before any task is created
+    if len(title) > TaskValidator.MAX_TITLE_LENGTH:
+        return (f"Task {task_index + 1}: 'title' must be {TaskValidator.MAX_TITLE_LENGTH} characters or less "
+                f"(current: {len(title)} characters)")
+    
+    content = task_data.get('content')
+    if content is not None and not isinstance(content, str):
+        return f"Task {task_index + 1}: 'content' must be a string"
+    if content and len(content) > TaskValidator.MAX_CONTENT_LENGTH:
+        return (f"Task {task_index + 1}: 'content' must be {TaskValidator.MAX_CONTENT_LENGTH} characters or less "
+                f"(current: {len(content)} characters)")
+    
     # Validate priority if provided
+    # Batch entries are raw JSON, so rule out unhashable values (lists, dicts)
+    # before the frozenset lookup; bool is excluded as it would match 0 and 1
     priority = task_data.get('priority')
-    if priority is not None and priority not in [0, 1, 3, 5]:
+    if priority is not None and (
+        not isinstance(priority, int) or isinstance(priority, bool) or priority not in VALID_PRIORITIES
+    ):
         return f"Task {task_index + 1}: Invalid priority {priority}. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)"
     
     # Validate dates if provided
     for date_field in ['start_date', 'due_date']:
         date_str = task_data.get(date_field)
-        if date_str:
-            try:
-                # Try to parse the date to validate it
-                # Handle both with and without timezone info
-                if date_str.endswith('Z'):
-                    datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                elif '+' in date_str or date_str.endswith(('00', '30')):
-                    datetime.fromisoformat(date_str)
-                else:
-                    # Assume local timezone if no timezone specified
-                    datetime.fromisoformat(date_str)
-            except ValueError:
-                return f"Task {task_index + 1}: Invalid {date_field} format '{date_str}'. Use ISO format: YYYY-MM-DDTHH:mm:ss or with timezone"
+        # Checked without raising: a bad date in a large batch is reported, not unwound
+        if date_str and not TaskValidator.is_valid_date(date_str):
+            return f"Task {task_index + 1}: Invalid {date_field} format '{date_str}'. Use ISO format: YYYY-MM-DDTHH:mm:ss or with timezone"
     
     return None
 
-def _get_project_tasks_by_filter(projects: List[Dict], filter_func, filter_name: str) -> str:
+async def _fetch_projects_data(client: TickTickClient, project_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Fetch project data (tasks and columns) for several projects concurrently.
+    
+    The client is synchronous, so each request runs in a worker thread; at most
+    MAX_CONCURRENT_REQUESTS requests are in flight at once to stay clear of
+    TickTick rate limits.
+    
+    Returns:
+        Project data dicts (or error dicts) in the same order as project_ids
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch(project_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(client.get_project_with_data, project_id)
+    
+    return await asyncio.gather(*(fetch(project_id) for project_id in project_ids))
+
+async def _get_project_tasks_by_filter(client: TickTickClient, projects: List[Dict], filter_func, filter_name: str,
+                                       requires_due_date: bool = False) -> str:
     """
     Helper function to filter tasks across all projects.
     
     Args:
+        client: The client the calling tool already resolved
         projects: List of project dictionaries
         filter_func: Function that takes a task and returns True if it matches the filter
         filter_name: Name of the filter for output formatting
+        requires_due_date: True if filter_func can only match tasks with a dueDate;
+            undated tasks are then skipped without calling it
     
     Returns:
         Formatted string of filtered tasks
@@ -864,70 +862,64 @@ def _get_project_tasks_by_filter(projects: List[Dict], filter_func, filter_name:
     if not projects:
         return "No projects found."
     
-    client = get_client()
-    result = f"Found {len(projects)} projects:\n\n"
+    # Closed projects are skipped entirely, so they are neither fetched nor counted
+    open_projects = [project for project in projects if not project.get('closed')]
+    parts = [f"Found {len(open_projects)} projects:\n\n"]
     
-    for i, project in enumerate(projects, 1):
-        if project.get('closed'):
-            continue
-            
-        project_id = project.get('id', 'No ID')
-        project_data = client.get_project_with_data(project_id)
+    # Fetch all open projects up front instead of one round-trip at a time
+    projects_data = await _fetch_projects_data(
+        client, [project.get('id', 'No ID') for project in open_projects]
+    )
+    
+    for i, (project, project_data) in enumerate(zip(open_projects, projects_data), 1):
         tasks = project_data.get('tasks', [])
         
         if not tasks:
-            result += f"Project {i}:\n{format_project(project)}"
-            result += f"With 0 tasks that are to be '{filter_name}' in this project :\n\n\n"
+            parts.append(f"Project {i}:\n{format_project(project)}")
+            parts.append(f"With 0 tasks that are to be '{filter_name}' in this project :\n\n\n")
             continue
         
         # Filter tasks using the provided function
-        filtered_tasks = [(t, task) for t, task in enumerate(tasks, 1) if filter_func(task)]
+        if requires_due_date:
+            filtered_tasks = [task for task in tasks if task.get('dueDate') and filter_func(task)]
+        else:
+            filtered_tasks = [task for task in tasks if filter_func(task)]
         
-        result += f"Project {i}:\n{format_project(project)}"
-        result += f"With {len(filtered_tasks)} tasks that are to be '{filter_name}' in this project :\n"
+        parts.append(f"Project {i}:\n{format_project(project)}")
+        parts.append(f"With {len(filtered_tasks)} tasks that are to be '{filter_name}' in this project :\n")
         
-        for t, task in filtered_tasks:
-            result += f"Task {t}:\n{format_task(task)}\n"
+        for t, task in enumerate(filtered_tasks, 1):
+            parts.append(f"Task {t}:\n")
+            _append_task(parts, task)
+            parts.append("\n")
         
-        result += "\n\n"
+        parts.append("\n\n")
     
-    return result
+    return "".join(parts)
 
 # New MCP Tools for Tasks
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_all_tasks() -> str:
     """Get all tasks from TickTick. Ignores closed projects."""
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        # Check if result is an error dict
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        # Type narrowing: projects_result must be a List
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def all_tasks_filter(task: Dict[str, Any]) -> bool:
-            return True  # Include all tasks
-        
-        return _get_project_tasks_by_filter(projects, all_tasks_filter, "included")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_all_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_all_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_all_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_all_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    # Check if result is an error dict
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    # Type narrowing: projects_result must be a List
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    def all_tasks_filter(task: Dict[str, Any]) -> bool:
+        return True  # Include all tasks
+    
+    return await _get_project_tasks_by_filter(client, projects, all_tasks_filter, "included")
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_tasks_by_priority(priority_id: int) -> str:
     """
     Get all tasks from TickTick by priority. Ignores closed projects.
@@ -938,125 +930,80 @@ async def get_tasks_by_priority(priority_id: int) -> str:
     if priority_id not in PRIORITY_MAP:
         return f"Invalid priority_id. Valid values: {list(PRIORITY_MAP.keys())}"
     
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def priority_filter(task: Dict[str, Any]) -> bool:
-            return task.get('priority', 0) == priority_id
-        
-        priority_name = f"{PRIORITY_MAP[priority_id]} ({priority_id})"
-        return _get_project_tasks_by_filter(projects, priority_filter, f"priority '{priority_name}'")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_tasks_by_priority: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_tasks_by_priority: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_tasks_by_priority: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_tasks_by_priority: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    def priority_filter(task: Dict[str, Any]) -> bool:
+        return task.get('priority', 0) == priority_id
+    
+    priority_name = f"{PRIORITY_MAP[priority_id]} ({priority_id})"
+    return await _get_project_tasks_by_filter(client, projects, priority_filter, f"priority '{priority_name}'")
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_tasks_due_today() -> str:
     """Get all tasks from TickTick that are due today. Ignores closed projects."""
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def today_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_due_today(task)
-        
-        return _get_project_tasks_by_filter(projects, today_filter, "due today")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_tasks_due_today: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in the LibreChat UI."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_tasks_due_today: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to retrieve tasks. Please try again later."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_tasks_due_today: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_tasks_due_today: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    # Compute the date boundary once per call, not once per task
+    today = datetime.now(timezone.utc).date()
+    
+    def today_filter(task: Dict[str, Any]) -> bool:
+        return _is_task_due_on(task, today)
+    
+    return await _get_project_tasks_by_filter(client, projects, today_filter, "due today", requires_due_date=True)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_overdue_tasks() -> str:
     """Get all overdue tasks from TickTick. Ignores closed projects."""
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def overdue_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_overdue(task)
-        
-        return _get_project_tasks_by_filter(projects, overdue_filter, "overdue")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_overdue_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_overdue_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_overdue_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_overdue_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    now = datetime.now(timezone.utc)
+    
+    def overdue_filter(task: Dict[str, Any]) -> bool:
+        return _is_task_overdue(task, now)
+    
+    return await _get_project_tasks_by_filter(client, projects, overdue_filter, "overdue", requires_due_date=True)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_tasks_due_tomorrow() -> str:
     """Get all tasks from TickTick that are due tomorrow. Ignores closed projects."""
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def tomorrow_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_due_in_days(task, 1)
-        
-        return _get_project_tasks_by_filter(projects, tomorrow_filter, "due tomorrow")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_tasks_due_tomorrow: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_tasks_due_tomorrow: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_tasks_due_tomorrow: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_tasks_due_tomorrow: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
     
+    tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).date()
+    
+    def tomorrow_filter(task: Dict[str, Any]) -> bool:
+        return _is_task_due_on(task, tomorrow)
+    
+    return await _get_project_tasks_by_filter(client, projects, tomorrow_filter, "due tomorrow", requires_due_date=True)
+
 @mcp.tool()
+@handle_mcp_errors
 async def get_tasks_due_in_days(days: int) -> str:
     """
     Get all tasks from TickTick that are due in exactly X days. Ignores closed projects.
@@ -1067,75 +1014,45 @@ async def get_tasks_due_in_days(days: int) -> str:
     if days < 0:
         return "Days must be a non-negative integer."
     
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def days_filter(task: Dict[str, Any]) -> bool:
-            return _is_task_due_in_days(task, days)
-        
-        day_description = "today" if days == 0 else f"in {days} day{'s' if days != 1 else ''}"
-        return _get_project_tasks_by_filter(projects, days_filter, f"due {day_description}")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_tasks_due_in_days: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_tasks_due_in_days: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_tasks_due_in_days: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_tasks_due_in_days: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    target_date = (datetime.now(timezone.utc) + timedelta(days=days)).date()
+    
+    def days_filter(task: Dict[str, Any]) -> bool:
+        return _is_task_due_on(task, target_date)
+    
+    day_description = "today" if days == 0 else f"in {days} day{'s' if days != 1 else ''}"
+    return await _get_project_tasks_by_filter(client, projects, days_filter, f"due {day_description}", requires_due_date=True)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_tasks_due_this_week() -> str:
     """Get all tasks from TickTick that are due within the next 7 days. Ignores closed projects."""
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def week_filter(task: Dict[str, Any]) -> bool:
-            due_date = task.get('dueDate')
-            if not due_date:
-                return False
-            
-            try:
-                task_due_date = datetime.strptime(due_date, "%Y-%m-%dT%H:%M:%S.%f%z").date()
-                today = datetime.now(timezone.utc).date()
-                week_from_today = today + timedelta(days=7)
-                return today <= task_due_date <= week_from_today
-            except (ValueError, TypeError):
-                return False
-        
-        return _get_project_tasks_by_filter(projects, week_filter, "due this week")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_tasks_due_this_week: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_tasks_due_this_week: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_tasks_due_this_week: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_tasks_due_this_week: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    today = datetime.now(timezone.utc).date()
+    week_from_today = today + timedelta(days=7)
+    
+    def week_filter(task: Dict[str, Any]) -> bool:
+        task_due = _parse_due_date(task)
+        return task_due is not None and today <= task_due.date() <= week_from_today
+    
+    return await _get_project_tasks_by_filter(client, projects, week_filter, "due this week", requires_due_date=True)
 
 @mcp.tool()
+@handle_mcp_errors
 async def search_tasks(search_term: str) -> str:
     """
     Search for tasks in TickTick by title, content, or subtask titles. Ignores closed projects.
@@ -1146,34 +1063,24 @@ async def search_tasks(search_term: str) -> str:
     if not search_term.strip():
         return "Search term cannot be empty."
     
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def search_filter(task: Dict[str, Any]) -> bool:
-            return _task_matches_search(task, search_term)
-        
-        return _get_project_tasks_by_filter(projects, search_filter, f"matching '{search_term}'")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in search_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in search_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in search_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in search_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    # Compile once; a case-insensitive scan avoids lowercasing every field of every task
+    pattern = re.compile(re.escape(search_term), re.IGNORECASE)
+    
+    def search_filter(task: Dict[str, Any]) -> bool:
+        return _task_matches_search(task, pattern)
+    
+    return await _get_project_tasks_by_filter(client, projects, search_filter, f"matching '{search_term}'")
 
 @mcp.tool()
+@handle_mcp_errors
 async def batch_create_tasks(tasks: List[Dict[str, Any]]) -> str:
     """
     Create multiple tasks in TickTick at once
@@ -1213,162 +1120,124 @@ async def batch_create_tasks(tasks: List[Dict[str, Any]]) -> str:
     if validation_errors:
         return "Validation errors found:\n" + "\n".join(validation_errors)
     
-    # Create tasks one by one and collect results
-    created_tasks = []
-    failed_tasks = []
+    # Create tasks concurrently (bounded, to respect rate limits) and collect results
+    client = await asyncio.to_thread(get_client)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
     
-    try:
-        client = get_client()
-        
-        for i, task_data in enumerate(tasks):
-            try:
-                # Extract task parameters with defaults
-                title = task_data['title']
-                project_id = task_data['project_id']
-                content = task_data.get('content')
-                start_date = task_data.get('start_date')
-                due_date = task_data.get('due_date')
-                priority = task_data.get('priority', 0)
-                
-                # Create the task
-                result = client.create_task(
-                    title=title,
-                    project_id=project_id,
-                    content=content,
-                    start_date=start_date,
-                    due_date=due_date,
-                    priority=priority
+    async def create_one(i: int, task_data: Dict[str, Any]) -> Tuple[Optional[tuple], Optional[str]]:
+        """Create one task. Returns (created_entry, None) or (None, failure_message)."""
+        title = task_data.get('title', 'Unknown')
+        try:
+            async with semaphore:
+                result = await asyncio.to_thread(
+                    client.create_task,
+                    title=task_data['title'],
+                    project_id=task_data['project_id'],
+                    content=task_data.get('content'),
+                    start_date=task_data.get('start_date'),
+                    due_date=task_data.get('due_date'),
+                    priority=task_data.get('priority', 0)
                 )
-                
-                if 'error' in result:
-                    # Parse error type for specific messaging
-                    error_type = result.get('type', 'unknown')
-                    error_msg = result['error']
-                    
-                    if error_type == 'auth':
-                        failed_tasks.append(f"Task {i + 1} ('{title}'): Authentication failed (401)")
-                    elif error_type == 'permission':
-                        failed_tasks.append(f"Task {i + 1} ('{title}'): Permission denied (403)")
-                    elif error_type == 'not_found':
-                        failed_tasks.append(f"Task {i + 1} ('{title}'): Project not found (404)")
-                    elif error_type == 'network':
-                        failed_tasks.append(f"Task {i + 1} ('{title}'): Network error")
-                    else:
-                        failed_tasks.append(f"Task {i + 1} ('{title}'): {error_msg}")
-                else:
-                    created_tasks.append((i + 1, title, result))
-                    
-            except ValueError as e:
-                # Validation errors from TaskValidator
-                failed_tasks.append(f"Task {i + 1} ('{task_data.get('title', 'Unknown')}'): Validation error - {str(e)}")
-            except Exception as e:
-                failed_tasks.append(f"Task {i + 1} ('{task_data.get('title', 'Unknown')}'): {str(e)}")
-        
-        # Format the results
-        result_message = f"Batch task creation completed.\n\n"
-        result_message += f"Successfully created: {len(created_tasks)} tasks\n"
-        result_message += f"Failed: {len(failed_tasks)} tasks\n\n"
-        
-        if created_tasks:
-            result_message += "✅ Successfully Created Tasks:\n"
-            for task_num, title, task_obj in created_tasks:
-                result_message += f"{task_num}. {title} (ID: {task_obj.get('id', 'Unknown')})\n"
-            result_message += "\n"
-        
-        if failed_tasks:
-            result_message += "❌ Failed Tasks:\n"
-            for error in failed_tasks:
-                result_message += f"{error}\n"
-        
-        return result_message
+        except ValueError as e:
+            # Validation errors from TaskValidator
+            return None, f"Task {i + 1} ('{title}'): Validation error - {str(e)}"
+        except Exception as e:
+            return None, f"Task {i + 1} ('{title}'): {str(e)}"
         
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in batch_create_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat before creating tasks."
-    except TickTickAPIError as e:
-        logger.error(f"API error in batch_create_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in batch_create_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in batch_create_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+        if 'error' in result:
+            # Parse error type for specific messaging
+            error_type = result.get('type', 'unknown')
+            
+            if error_type == 'auth':
+                return None, f"Task {i + 1} ('{title}'): Authentication failed (401)"
+            elif error_type == 'permission':
+                return None, f"Task {i + 1} ('{title}'): Permission denied (403)"
+            elif error_type == 'not_found':
+                return None, f"Task {i + 1} ('{title}'): Project not found (404)"
+            elif error_type == 'network':
+                return None, f"Task {i + 1} ('{title}'): Network error"
+            else:
+                return None, f"Task {i + 1} ('{title}'): {result['error']}"
+        
+        return (i + 1, title, result), None
+    
+    # gather() preserves input order, so results are reported in task order
+    outcomes = await asyncio.gather(*(create_one(i, task_data) for i, task_data in enumerate(tasks)))
+    created_tasks = [created for created, _ in outcomes if created]
+    failed_tasks = [failure for _, failure in outcomes if failure]
+    
+    # Format the results
+    parts = [
+        "Batch task creation completed.\n\n",
+        f"Successfully created: {len(created_tasks)} tasks\n",
+        f"Failed: {len(failed_tasks)} tasks\n\n",
+    ]
+    
+    if created_tasks:
+        parts.append("✅ Successfully Created Tasks:\n")
+        for task_num, title, task_obj in created_tasks:
+            parts.append(f"{task_num}. {title} (ID: {task_obj.get('id', 'Unknown')})\n")
+        parts.append("\n")
+    
+    if failed_tasks:
+        parts.append("❌ Failed Tasks:\n")
+        for error in failed_tasks:
+            parts.append(f"{error}\n")
+    
+    return "".join(parts)
 
 # New MCP Tools for Getting things done framework (Priority / Due Dates)
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_engaged_tasks() -> str:
     """
     Get all tasks from TickTick that are "Engaged".
     This includes tasks marked as high priority (5), due today or overdue.
     """
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def engaged_filter(task: Dict[str, Any]) -> bool:
-            is_high_priority = task.get('priority', 0) == 5
-            is_overdue = _is_task_overdue(task)
-            is_today = _is_task_due_today(task)
-            return is_high_priority or is_overdue or is_today
-        
-        return _get_project_tasks_by_filter(projects, engaged_filter, "engaged")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_engaged_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_engaged_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_engaged_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_engaged_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+    
+    def engaged_filter(task: Dict[str, Any]) -> bool:
+        return _classify_gtd_task(task, now, today, tomorrow)[0]
+    
+    return await _get_project_tasks_by_filter(client, projects, engaged_filter, "engaged")
 
 @mcp.tool()
+@handle_mcp_errors
 async def get_next_tasks() -> str:
     """
     Get all tasks from TickTick that are "Next".
     This includes tasks marked as medium priority (3) or due tomorrow.
     """
-    try:
-        client = get_client()
-        projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = client.get_projects()
-        
-        if isinstance(projects_result, dict) and 'error' in projects_result:
-            return f"Error fetching projects: {projects_result['error']}"
-        
-        projects: List[Dict[str, Any]] = projects_result  # type: ignore
-        
-        def next_filter(task: Dict[str, Any]) -> bool:
-            is_medium_priority = task.get('priority', 0) == 3
-            is_due_tomorrow = _is_task_due_in_days(task, 1)
-            return is_medium_priority or is_due_tomorrow
-        
-        return _get_project_tasks_by_filter(projects, next_filter, "next")
-        
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in get_next_tasks: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in get_next_tasks: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nThe TickTick service may be experiencing issues."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in get_next_tasks: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in get_next_tasks: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    client = await asyncio.to_thread(get_client)
+    projects_result: Union[List[Dict[str, Any]], Dict[str, Any]] = await asyncio.to_thread(client.get_projects)
+    
+    if isinstance(projects_result, dict) and 'error' in projects_result:
+        return f"Error fetching projects: {projects_result['error']}"
+    
+    projects: List[Dict[str, Any]] = projects_result  # type: ignore
+    
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    tomorrow = today + timedelta(days=1)
+    
+    def next_filter(task: Dict[str, Any]) -> bool:
+        return _classify_gtd_task(task, now, today, tomorrow)[1]
+    
+    return await _get_project_tasks_by_filter(client, projects, next_filter, "next")
 
 @mcp.tool()
+@handle_mcp_errors
 async def create_subtask(
     subtask_title: str,
     parent_task_id: str,
@@ -1387,61 +1256,53 @@ async def create_subtask(
         priority: Priority level (0: None, 1: Low, 3: Medium, 5: High) (optional)
     """
     # Validate priority
-    if priority not in [0, 1, 3, 5]:
+    if priority not in VALID_PRIORITIES:
         return "Invalid priority. Must be 0 (None), 1 (Low), 3 (Medium), or 5 (High)."
     
-    try:
-        client = get_client()
-        subtask = client.create_subtask(
-            subtask_title=subtask_title,
-            parent_task_id=parent_task_id,
-            project_id=project_id,
-            content=content,
-            priority=priority
+    client = await asyncio.to_thread(get_client)
+    subtask = await asyncio.to_thread(
+        client.create_subtask,
+        subtask_title=subtask_title,
+        parent_task_id=parent_task_id,
+        project_id=project_id,
+        content=content,
+        priority=priority
+    )
+    
+    if 'error' in subtask:
+        return parse_error_response(
+            subtask,
+            permission_hint="You don't have permission to create subtasks.",
+            not_found=f"❌ Parent Task Not Found: Cannot create subtask.\n\nParent Task ID: {parent_task_id}\nThe parent task may have been deleted."
         )
-        
-        if 'error' in subtask:
-            error_type = subtask.get('type', 'unknown')
-            error_msg = subtask['error']
-            
-            if error_type == 'auth':
-                return f"❌ Authentication Error: {error_msg}\n\nPlease re-authenticate with TickTick in LibreChat."
-            elif error_type == 'permission':
-                return f"❌ Permission Denied: {error_msg}\n\nYou don't have permission to create subtasks."
-            elif error_type == 'not_found':
-                return f"❌ Parent Task Not Found: Cannot create subtask.\n\nParent Task ID: {parent_task_id}\nThe parent task may have been deleted."
-            elif error_type == 'network':
-                return f"❌ Network Error: {error_msg}\n\nPlease check your internet connection and try again."
-            else:
-                return f"❌ API Error: {error_msg}"
-        
-        return f"✅ Subtask created successfully:\n\n" + format_task(subtask)
-    except ValueError as e:
-        # Validation errors from TaskValidator
-        logger.error(f"Validation error in create_subtask: {e}")
-        return f"❌ Validation Error: {str(e)}"
-    except TickTickAuthenticationError as e:
-        logger.error(f"Authentication error in create_subtask: {e}")
-        return f"❌ Authentication Error: {str(e)}\n\nPlease authenticate with TickTick in LibreChat."
-    except TickTickAPIError as e:
-        logger.error(f"API error in create_subtask: {e}")
-        return f"❌ TickTick API Error: {str(e)}\n\nUnable to create the subtask."
-    except TickTickNetworkError as e:
-        logger.error(f"Network error in create_subtask: {e}")
-        return f"❌ Network Error: {str(e)}\n\nPlease check your internet connection and try again."
-    except Exception as e:
-        logger.error(f"Unexpected error in create_subtask: {e}")
-        return f"❌ Unexpected Error: {str(e)}"
+    
+    return f"✅ Subtask created successfully:\n\n" + format_task(subtask)
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop for the stdio server.
+    
+    Uses uvloop when it is installed.
+    """
+    try:
+        import uvloop
+        return uvloop.new_event_loop()
+    except ImportError:
+        return asyncio.new_event_loop()
 
 def main():
     """Main entry point for the MCP server."""
-    # Initialize the TickTick client
-    if not initialize_client():
+    # Fail fast on missing credentials; this needs no network access
+    if os.getenv("TICKTICK_ACCESS_TOKEN") is None:
         logger.error("Failed to initialize TickTick client. Please check your API credentials.")
         return
     
-    # Run the server
-    mcp.run(transport='stdio')
+    # Verify connectivity off the startup path; tool calls still go through
+    # get_client() and report any failure that the warm-up ran into
+    threading.Thread(target=_warm_client, name="ticktick-warmup", daemon=True).start()
+    
+    # Run the server (equivalent to mcp.run(transport='stdio'), on our own loop)
+    anyio.run(mcp.run_stdio_async, backend_options={"loop_factory": _new_event_loop})
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
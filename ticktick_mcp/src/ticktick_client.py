@@ -1,6 +1,11 @@
 import os
-import json
+import re
+import sys
+import time
+import random
 import base64
+import threading
+from collections import OrderedDict
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -8,9 +13,37 @@ import logging
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple, Union
 
+try:
+    import orjson  # optional: faster (de)serialization of large task payloads
+except ImportError:
+    orjson = None
+
+# Raised for a non-JSON response body (e.g. an HTML error page) by whichever
+# parser _make_request uses
+_JSONDecodeError = orjson.JSONDecodeError if orjson else requests.exceptions.JSONDecodeError
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# fromisoformat accepts 'Z' and '+HHMM' offsets natively only from Python 3.11
+_NORMALIZE_ISO_OFFSET = sys.version_info < (3, 11)
+_COMPACT_OFFSET_RE = re.compile(r'([+-]\d{2})(\d{2})$')
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO date/datetime string, including TickTick's '+0000' offsets.
+    
+    Raises:
+        ValueError: If the string is not a valid ISO date/datetime
+    """
+    if _NORMALIZE_ISO_OFFSET:
+        if value[-1:] == 'Z':
+            value = value[:-1] + "+00:00"
+        else:
+            value = _COMPACT_OFFSET_RE.sub(r'\1:\2', value)
+    return datetime.fromisoformat(value)
+
 
 class TaskValidator:
     """Validator for task and project input data."""
@@ -20,6 +53,9 @@ class TaskValidator:
     MAX_PROJECT_NAME_LENGTH = 200
     VALID_PRIORITIES = (0, 1, 3, 5)
     
+    # Built once at import; the membership check runs on every task write
+    _VALID_PRIORITY_SET = frozenset(VALID_PRIORITIES)
+    
     @staticmethod
     def validate_task_title(title: str) -> None:
         """
@@ -31,7 +67,7 @@ class TaskValidator:
         Raises:
             ValueError: If title is invalid
         """
-        if not title or not title.strip():
+        if not title or title.isspace():
             raise ValueError("Task title cannot be empty")
         if len(title) > TaskValidator.MAX_TITLE_LENGTH:
             raise ValueError(
@@ -50,7 +86,7 @@ class TaskValidator:
         Raises:
             ValueError: If name is invalid
         """
-        if not name or not name.strip():
+        if not name or name.isspace():
             raise ValueError("Project name cannot be empty")
         if len(name) > TaskValidator.MAX_PROJECT_NAME_LENGTH:
             raise ValueError(
@@ -86,12 +122,26 @@ class TaskValidator:
         Raises:
             ValueError: If priority is invalid
         """
-        if priority not in TaskValidator.VALID_PRIORITIES:
+        if priority not in TaskValidator._VALID_PRIORITY_SET:
             raise ValueError(
                 f"Priority must be one of {TaskValidator.VALID_PRIORITIES} "
                 f"(0=None, 1=Low, 3=Medium, 5=High), got {priority}"
             )
     
+    @staticmethod
+    def is_valid_date(date_str: str) -> bool:
+        """
+        Check whether a string is an ISO date/datetime, without raising.
+        """
+        if not isinstance(date_str, str):
+            return False
+        
+        try:
+            parse_iso_datetime(date_str)
+        except ValueError:
+            return False
+        return True
+    
     @staticmethod
     def validate_date(date_str: Optional[str], field_name: str) -> None:
         """
@@ -107,26 +157,52 @@ class TaskValidator:
         if not date_str:
             return
         
-        try:
-            # Try parsing with timezone
-            if date_str.endswith('Z'):
-                datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            elif '+' in date_str or date_str.count(':') >= 2:
-                datetime.fromisoformat(date_str)
-            else:
-                # Try as date only
-                datetime.fromisoformat(date_str)
-        except (ValueError, AttributeError) as e:
+        if not TaskValidator.is_valid_date(date_str):
             raise ValueError(
                 f"{field_name} must be in ISO format (e.g., 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:mm:ss' or with timezone). "
                 f"Got: {date_str}"
             )
 
+class _JitteredRetry(Retry):
+    """
+    Retry with up to 50% random jitter on the exponential backoff.
+    
+    Without jitter, processes that hit a 429 together (one per LibreChat user)
+    retry in lockstep and collide again. Retry-After is still honoured first.
+    """
+    
+    BACKOFF_CAP = 30  # seconds
+    
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return min(self.BACKOFF_CAP, backoff + random.uniform(0, 0.5 * backoff))
+
 class TickTickClient:
     """
     Client for the TickTick API using OAuth2 authentication.
     """
     
+    # Seconds a successful get_projects() result is reused before refetching
+    PROJECTS_CACHE_TTL = 30
+    # Refresh this many seconds before the access token's reported expiry
+    TOKEN_REFRESH_MARGIN = 60
+    # Most recently used list responses kept for conditional GETs
+    CONDITIONAL_CACHE_SIZE = 32
+    
+    # Only the project list and per-project task lists are revalidated; they are
+    # the large, frequently re-read responses
+    _CONDITIONAL_ENDPOINT_RE = re.compile(r'^/project(?:/[^/]+/data)?$')
+    
+    # (message, type) for HTTP errors with a fixed meaning; other 5xx map to
+    # "server_error" and anything else to "api"
+    _HTTP_ERROR_TEMPLATES: Dict[int, Tuple[str, str]] = {
+        401: ("Authentication failed. Token expired or invalid.", "auth"),
+        403: ("Permission denied. You don't have access to this resource.", "permission"),
+        404: ("Resource not found. It may have been deleted.", "not_found"),
+    }
+    
     def __init__(self):
         """
         Initialize TickTick client from environment variables.
@@ -157,15 +233,16 @@ class TickTickClient:
         self.headers = {
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
-            "Accept-Encoding": None,
+            # Accept-Encoding is left to requests (gzip, deflate): task payloads
+            # are repetitive JSON and compress several-fold
             "User-Agent": 'curl/8.7.1'
         }
         
         # Initialize session with connection pooling and retry logic
         self.session = requests.Session()
-        retry_strategy = Retry(
+        retry_strategy = _JitteredRetry(
             total=3,  # Retry up to 3 times
-            backoff_factor=1,  # Wait 1s, 2s, 4s between retries
+            backoff_factor=1,  # Wait ~1s, 2s, 4s (plus jitter) between retries
             status_forcelist=[429, 500, 502, 503, 504],  # Retry on these status codes
             allowed_methods=["GET", "POST", "PUT", "DELETE"]  # Retry on all methods
         )
@@ -176,6 +253,21 @@ class TickTickClient:
         )
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
+        
+        # (fetched_at, projects) from the last successful get_projects() call
+        self._projects_cache: Optional[Tuple[float, List[Dict]]] = None
+        
+        # url -> (validator headers, parsed body) for conditional GETs, in LRU
+        # order; only populated when the API sends an ETag or Last-Modified header
+        self._conditional_cache: "OrderedDict[str, Tuple[Dict[str, str], Any]]" = OrderedDict()
+        # Fan-out tools read and update the cache from worker threads
+        self._conditional_lock = threading.Lock()
+        
+        # Monotonic deadline for a proactive refresh; only known once a refresh
+        # response has reported expires_in
+        self._token_expiry: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        self._basic_auth: Optional[str] = None
     
     def _refresh_access_token(self) -> bool:
         """
@@ -198,19 +290,14 @@ class TickTickClient:
             "refresh_token": self.refresh_token
         }
         
-        # Prepare Basic Auth credentials
-        auth_str = f"{self.client_id}:{self.client_secret}"
-        auth_bytes = auth_str.encode('ascii')
-        auth_b64 = base64.b64encode(auth_bytes).decode('ascii')
-        
         headers = {
-            "Authorization": f"Basic {auth_b64}",
+            "Authorization": self._basic_auth_header(),
             "Content-Type": "application/x-www-form-urlencoded"
         }
         
         try:
-            # Send the token request
-            response = requests.post(self.token_url, data=token_data, headers=headers)
+            # Send the token request over the pooled session (reuses keep-alive connections)
+            response = self.session.post(self.token_url, data=token_data, headers=headers)
             response.raise_for_status()
             
             # Parse the response
@@ -234,6 +321,47 @@ class TickTickClient:
             logger.error(f"Error refreshing access token: {e}")
             return False
     
+    def _basic_auth_header(self) -> str:
+        """Basic auth header for the token endpoint, encoded once per client."""
+        if self._basic_auth is None:
+            auth_str = f"{self.client_id}:{self.client_secret}"
+            auth_b64 = base64.b64encode(auth_str.encode('ascii')).decode('ascii')
+            self._basic_auth = f"Basic {auth_b64}"
+        return self._basic_auth
+    
+    def _refresh_access_token_once(self, rejected_auth: str) -> bool:
+        """
+        Refresh the access token unless another thread already replaced it.
+        
+        Concurrent tool calls share one client, so several requests can find
+        the token expired at the same moment; only the first one refreshes.
+        
+        Args:
+            rejected_auth: The Authorization header the caller found stale
+        
+        Returns:
+            True if a usable token is now in place, False otherwise
+        """
+        with self._refresh_lock:
+            if self.headers["Authorization"] != rejected_auth:
+                return True
+            return self._refresh_access_token()
+    
+    def _refresh_if_expiring(self) -> None:
+        """
+        Refresh the access token ahead of its reported expiry.
+        
+        The expiry is re-checked under the lock, so threads that saw the same
+        stale deadline do not refresh again once the first one has finished.
+        """
+        with self._refresh_lock:
+            if self._token_expiry is None or time.monotonic() < self._token_expiry:
+                return
+            logger.info("Access token about to expire. Refreshing ahead of the request...")
+            if not self._refresh_access_token():
+                # Fall back to refreshing on 401 rather than retrying every request
+                self._token_expiry = None
+    
     def _save_tokens_to_env(self, tokens: Dict[str, str]) -> None:
         """
         Update instance tokens after refresh.
@@ -256,6 +384,12 @@ class TickTickClient:
         # Update authorization header
         self.headers["Authorization"] = f"Bearer {self.access_token}"
 
+        # Schedule the next refresh ahead of expiry instead of waiting for a 401
+        if tokens.get('expires_in'):
+            self._token_expiry = time.monotonic() + int(tokens['expires_in']) - self.TOKEN_REFRESH_MARGIN
+        else:
+            self._token_expiry = None
+
         # Log warning about token persistence
         logger.warning(
             "Access token refreshed successfully. "
@@ -280,12 +414,22 @@ class TickTickClient:
         """
         url = f"{self.base_url}{endpoint}"
         
+        if self._token_expiry is not None and time.monotonic() >= self._token_expiry:
+            self._refresh_if_expiring()
+        
         try:
+            sent_auth = self.headers["Authorization"]
+            # orjson serializes straight to bytes; Content-Type is already JSON
+            body = {"data": orjson.dumps(data)} if orjson and data is not None else {"json": data}
             # Make the request using session (with connection pooling)
+            conditional_get = method == "GET" and self._CONDITIONAL_ENDPOINT_RE.match(endpoint)
+            conditional = self._conditional_cache.get(url) if conditional_get else None
             if method == "GET":
-                response = self.session.get(url, headers=self.headers)
+                # Revalidate a previously seen body; a 304 carries no payload
+                headers = {**self.headers, **conditional[0]} if conditional else self.headers
+                response = self.session.get(url, headers=headers)
             elif method == "POST":
-                response = self.session.post(url, headers=self.headers, json=data)
+                response = self.session.post(url, headers=self.headers, **body)
             elif method == "DELETE":
                 response = self.session.delete(url, headers=self.headers)
             else:
@@ -296,62 +440,56 @@ class TickTickClient:
                 logger.info("Access token expired. Attempting to refresh...")
                 
                 # Try to refresh the access token
-                if self._refresh_access_token():
+                if self._refresh_access_token_once(sent_auth):
                     # Retry the request with the new token
                     if method == "GET":
                         response = self.session.get(url, headers=self.headers)
                     elif method == "POST":
-                        response = self.session.post(url, headers=self.headers, json=data)
+                        response = self.session.post(url, headers=self.headers, **body)
                     elif method == "DELETE":
                         response = self.session.delete(url, headers=self.headers)
             
             # Raise an exception for 4xx/5xx status codes
             response.raise_for_status()
             
+            if response.status_code == 304 and conditional:
+                with self._conditional_lock:
+                    if url in self._conditional_cache:
+                        self._conditional_cache.move_to_end(url)
+                return conditional[1]
+            
             # Return empty dict for 204 No Content
-            if response.status_code == 204 or response.text == "":
+            if response.status_code == 204 or not response.content:
                 return {}
             
-            return response.json()
+            result = orjson.loads(response.content) if orjson else response.json()
+            if conditional_get:
+                self._remember_validators(url, response, result)
+            return result
             
         except requests.exceptions.HTTPError as e:
             # HTTP errors (4xx, 5xx) - parse status code for specific handling
-            status_code = e.response.status_code if e.response else None
+            # Compare against None: a Response is falsy for any 4xx/5xx status
+            status_code = e.response.status_code if e.response is not None else None
             error_msg = str(e)
             
             logger.error(f"API HTTP error {status_code}: {error_msg}")
             
             # Categorize errors based on status code for tool-level handling
-            if status_code == 401:
-                return {
-                    "error": "Authentication failed. Token expired or invalid.",
-                    "status_code": 401,
-                    "type": "auth"
-                }
-            elif status_code == 403:
-                return {
-                    "error": "Permission denied. You don't have access to this resource.",
-                    "status_code": 403,
-                    "type": "permission"
-                }
-            elif status_code == 404:
-                return {
-                    "error": "Resource not found. It may have been deleted.",
-                    "status_code": 404,
-                    "type": "not_found"
-                }
+            template = self._HTTP_ERROR_TEMPLATES.get(status_code)
+            if template is not None:
+                error_msg, error_type = template
             elif status_code and status_code >= 500:
-                return {
-                    "error": f"TickTick server error ({status_code}). Please try again later.",
-                    "status_code": status_code,
-                    "type": "server_error"
-                }
+                error_msg = f"TickTick server error ({status_code}). Please try again later."
+                error_type = "server_error"
             else:
-                return {
-                    "error": error_msg,
-                    "status_code": status_code,
-                    "type": "api"
-                }
+                error_type = "api"
+            
+            return {
+                "error": error_msg,
+                "status_code": status_code,
+                "type": error_type
+            }
         
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Network connection failed: {e}")
@@ -369,7 +507,7 @@ class TickTickClient:
                 "type": "timeout"
             }
         
-        except requests.exceptions.RequestException as e:
+        except (_JSONDecodeError, requests.exceptions.RequestException) as e:
             logger.error(f"API request failed: {e}")
             return {
                 "error": str(e),
@@ -377,10 +515,44 @@ class TickTickClient:
                 "type": "unknown"
             }
     
+    def _remember_validators(self, url: str, response: requests.Response, result: Any) -> None:
+        """Store ETag/Last-Modified for a GET so the next fetch can be conditional."""
+        validators = {}
+        if response.headers.get("ETag"):
+            validators["If-None-Match"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        
+        with self._conditional_lock:
+            if validators:
+                self._conditional_cache[url] = (validators, result)
+                self._conditional_cache.move_to_end(url)
+                if len(self._conditional_cache) > self.CONDITIONAL_CACHE_SIZE:
+                    self._conditional_cache.popitem(last=False)
+            else:
+                self._conditional_cache.pop(url, None)
+    
     # Project methods
     def get_projects(self) -> Union[List[Dict], Dict[str, Any]]:
-        """Gets all projects for the user. Returns list of projects or error dict."""
-        return self._make_request("GET", "/project")
+        """
+        Gets all projects for the user. Returns list of projects or error dict.
+        
+        Successful results are cached for PROJECTS_CACHE_TTL seconds, since most
+        tool calls start by listing projects; project mutations clear the cache.
+        """
+        if self._projects_cache is not None:
+            fetched_at, projects = self._projects_cache
+            if time.monotonic() - fetched_at < self.PROJECTS_CACHE_TTL:
+                return projects
+        
+        result = self._make_request("GET", "/project")
+        if isinstance(result, list):
+            self._projects_cache = (time.monotonic(), result)
+        return result
+    
+    def _invalidate_projects_cache(self) -> None:
+        """Forget the cached project list so the next get_projects() refetches it."""
+        self._projects_cache = None
     
     def get_project(self, project_id: str) -> Dict[str, Any]:
         """Gets a specific project by ID. Returns project dict or error dict."""
@@ -415,7 +587,9 @@ class TickTickClient:
             "viewMode": view_mode,
             "kind": kind
         }
-        return self._make_request("POST", "/project", data)
+        result = self._make_request("POST", "/project", data)
+        self._invalidate_projects_cache()
+        return result
     
     def update_project(self, project_id: str, name: Optional[str] = None, color: Optional[str] = None, 
                        view_mode: Optional[str] = None, kind: Optional[str] = None) -> Dict[str, Any]:
@@ -446,11 +620,17 @@ class TickTickClient:
         if kind:
             data["kind"] = kind
             
-        return self._make_request("POST", f"/project/{project_id}", data)
+        result = self._make_request("POST", f"/project/{project_id}", data)
+        self._invalidate_projects_cache()
+        return result
     
     def delete_project(self, project_id: str) -> Dict[str, Any]:
         """Deletes a project."""
-        return self._make_request("DELETE", f"/project/{project_id}")
+        result = self._make_request("DELETE", f"/project/{project_id}")
+        self._invalidate_projects_cache()
+        with self._conditional_lock:
+            self._conditional_cache.pop(f"{self.base_url}/project/{project_id}/data", None)
+        return result
     
     # Task methods
     def get_task(self, project_id: str, task_id: str) -> Dict[str, Any]:
@@ -490,12 +670,12 @@ class TickTickClient:
             "projectId": project_id
         }
         
-        if content:
-            data["content"] = content
-        if start_date:
-            data["startDate"] = start_date
-        if due_date:
-            data["dueDate"] = due_date
+        # Optional text fields are only sent when non-empty
+        data.update({
+            key: value for key, value in (
+                ("content", content), ("startDate", start_date), ("dueDate", due_date)
+            ) if value
+        })
         if priority is not None:
             data["priority"] = priority
         if is_all_day is not None:
@@ -541,16 +721,15 @@ class TickTickClient:
             "projectId": project_id
         }
         
-        if title:
-            data["title"] = title
-        if content:
-            data["content"] = content
+        # Only fields that were provided (non-empty) are changed
+        data.update({
+            key: value for key, value in (
+                ("title", title), ("content", content),
+                ("startDate", start_date), ("dueDate", due_date)
+            ) if value
+        })
         if priority is not None:
             data["priority"] = priority
-        if start_date:
-            data["startDate"] = start_date
-        if due_date:
-            data["dueDate"] = due_date
             
         return self._make_request("POST", f"/task/{task_id}", data)
     